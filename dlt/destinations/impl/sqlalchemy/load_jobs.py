@@ -108,7 +108,7 @@ class SqlalchemyStagingCopyJob(SqlFollowupJob):
         sql_client: SqlalchemyClient,  # type: ignore[override]
         params: Optional[SqlJobParams] = None,
     ) -> List[str]:
-        statements: List[str] = []
+        statements: List[sa.sql.ClauseElement] = []
         for table in table_chain:
             # Tables must have already been created in metadata
             table_obj = sql_client.get_existing_table(table["name"])
@@ -116,21 +116,19 @@ class SqlalchemyStagingCopyJob(SqlFollowupJob):
                 sql_client.metadata, schema=sql_client.staging_dataset_name
             )
             if params["replace"]:
-                stmt = str(table_obj.delete().compile(dialect=sql_client.dialect))
-                if not stmt.endswith(";"):
-                    stmt += ";"
-                statements.append(stmt)
-
-            stmt = str(
-                table_obj.insert()
-                .from_select(
+                statements.append(table_obj.delete())
+
+            statements.append(
+                table_obj.insert().from_select(
                     [col.name for col in staging_table_obj.columns], staging_table_obj.select()
                 )
-                .compile(dialect=sql_client.dialect)
             )
-            if not stmt.endswith(";"):
-                stmt += ";"
-
-            statements.append(stmt)
 
-        return statements
+        # Compile all statements in a single pass with the dialect resolved once
+        dialect = sql_client.dialect
+        sql: List[str] = []
+        append = sql.append
+        for stmt in statements:
+            compiled = str(stmt.compile(dialect=dialect))
+            append(compiled if compiled[-1:] == ";" else compiled + ";")
+        return sql